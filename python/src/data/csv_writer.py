@@ -5,6 +5,7 @@ Writes trial summaries to CSV for quick analysis.
 """
 
 import csv
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any
@@ -19,9 +20,15 @@ class CSVWriter:
         self,
         output_dir: str = "./data",
         subject_id: str = "unknown",
-        task_type: str = "sos"
+        task_type: str = "sos",
+        flush_interval_s: float = 2.0
     ):
-        """Initialize CSV writer."""
+        """
+        Initialize CSV writer.
+
+        flush_interval_s: minimum time between flushes while writing trials;
+        the file is always flushed on end_experiment().
+        """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -34,12 +41,16 @@ class CSVWriter:
         self.writer = None
         self.trial_number = 0
 
+        # Flush policy
+        self.flush_interval_s = flush_interval_s
+        self._last_flush = time.monotonic()
+
     def start_experiment(self):
         """Start a new experiment CSV file."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.filename = self.output_dir / f"summary_{timestamp}.csv"
 
-        self.file = open(self.filename, 'w', newline='')
+        self.file = open(self.filename, 'w', newline='', buffering=1 << 16)
         self.writer = csv.writer(self.file)
 
         # Write header
@@ -50,6 +61,7 @@ class CSVWriter:
         ])
 
         self.trial_number = 0
+        self._last_flush = time.monotonic()
         print(f"CSV: Started summary -> {self.filename}")
 
     def write_trial(
@@ -68,25 +80,33 @@ class CSVWriter:
 
         self.trial_number += 1
 
-        self.writer.writerow([
+        self.writer.writerow((
             self.trial_number,
             self.task_type,
             self.subject_id,
-            datetime.now().isoformat(),
-            f"{duration_s:.3f}",
-            f"{rmse_x * 1000:.3f}",
-            f"{rmse_y * 1000:.3f}",
-            f"{rmse_total * 1000:.3f}",
+            datetime.now().isoformat(timespec='milliseconds'),
+            round(duration_s, 3),
+            round(rmse_x * 1000, 3),
+            round(rmse_y * 1000, 3),
+            round(rmse_total * 1000, 3),
             sample_count,
             'success' if success else 'failed',
             extra_info
-        ])
+        ))
+
+        if time.monotonic() - self._last_flush >= self.flush_interval_s:
+            self.flush()
 
-        self.file.flush()
+    def flush(self):
+        """Flush buffered rows to disk."""
+        if self.file is not None:
+            self.file.flush()
+        self._last_flush = time.monotonic()
 
     def end_experiment(self):
         """End experiment and close file."""
         if self.file is not None:
+            self.flush()
             self.file.close()
             self.file = None
             self.writer = None
@@ -4,76 +4,137 @@ HDF5 Data Writer for UHTP
 Logs experiment data in HDF5 format.
 """
 
+import time
 import h5py
 import numpy as np
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
-from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, Tuple
 
-from ..network.protocol import UDPMessage, TaskState
+from ..network.protocol import UDPMessage, TaskState, MESSAGE_DTYPE
+
+try:
+    import hdf5plugin
+except ImportError:
+    hdf5plugin = None
+
+
+# Column order of the TrialData buffer (also the HDF5 dataset names)
+TRIAL_COLUMNS = (
+    'timestamp', 'cursor_x', 'cursor_y', 'cursor_vx', 'cursor_vy',
+    'target_x', 'target_y',
+)
+
+# Datasets written per trial (buffer columns plus derived errors)
+TIMESERIES_COLUMNS = TRIAL_COLUMNS + ('error_x', 'error_y')
+
+# Timeseries datasets are written in full right after creation:
+# skip the fill-value pass and modification-time tracking
+_DATASET_OPTIONS = {'track_times': False, 'fill_time': 'never'}
+
+
+def _column(index: int) -> property:
+    """Read-only view of one recorded column."""
+    return property(lambda self: self._data[index, :self._n])
 
 
-@dataclass
 class TrialData:
-    """Container for trial time series data."""
-    timestamps: list = field(default_factory=list)
-    cursor_x: list = field(default_factory=list)
-    cursor_y: list = field(default_factory=list)
-    cursor_vx: list = field(default_factory=list)
-    cursor_vy: list = field(default_factory=list)
-    target_x: list = field(default_factory=list)
-    target_y: list = field(default_factory=list)
-    error_x: list = field(default_factory=list)
-    error_y: list = field(default_factory=list)
+    """
+    Container for trial time series data.
+
+    Samples are stored column-wise in a preallocated (columns, capacity)
+    float64 buffer that doubles in size when full, so recording a sample
+    is a single NumPy row store instead of one list append per field.
+    """
+
+    def __init__(self, initial_capacity: int = 4096):
+        """Initialize buffer (default capacity: ~68 s at 60Hz)."""
+        self._data = np.empty((len(TRIAL_COLUMNS), initial_capacity), dtype=np.float64)
+        self._n = 0
+
+    timestamps = _column(0)
+    cursor_x = _column(1)
+    cursor_y = _column(2)
+    cursor_vx = _column(3)
+    cursor_vy = _column(4)
+    target_x = _column(5)
+    target_y = _column(6)
+
+    def __len__(self) -> int:
+        return self._n
+
+    def _grow(self, min_capacity: int):
+        """Reallocate buffer to at least min_capacity samples (doubling)."""
+        capacity = self._data.shape[1]
+        while capacity < min_capacity:
+            capacity *= 2
+        data = np.empty((len(TRIAL_COLUMNS), capacity), dtype=np.float64)
+        data[:, :self._n] = self._data[:, :self._n]
+        self._data = data
 
     def append(self, msg: UDPMessage):
         """Append a message to the trial data."""
-        self.timestamps.append(msg.timestamp_us)
-        self.cursor_x.append(msg.cursor_x)
-        self.cursor_y.append(msg.cursor_y)
-        self.cursor_vx.append(msg.cursor_vx)
-        self.cursor_vy.append(msg.cursor_vy)
-        self.target_x.append(msg.target_x)
-        self.target_y.append(msg.target_y)
-        self.error_x.append(msg.cursor_x - msg.target_x)
-        self.error_y.append(msg.cursor_y - msg.target_y)
+        if self._n == self._data.shape[1]:
+            self._grow(self._n + 1)
+        self._data[:, self._n] = (
+            msg.timestamp_us,
+            msg.cursor_x,
+            msg.cursor_y,
+            msg.cursor_vx,
+            msg.cursor_vy,
+            msg.target_x,
+            msg.target_y,
+        )
+        self._n += 1
+
+    def extend(self, records: np.ndarray):
+        """Append a batch of MESSAGE_DTYPE records (one copy per column)."""
+        k = len(records)
+        if self._n + k > self._data.shape[1]:
+            self._grow(self._n + k)
+        for i, field in enumerate(MESSAGE_DTYPE.names[:len(TRIAL_COLUMNS)]):
+            self._data[i, self._n:self._n + k] = records[field]
+        self._n += k
 
     def clear(self):
-        """Clear all data."""
-        self.timestamps.clear()
-        self.cursor_x.clear()
-        self.cursor_y.clear()
-        self.cursor_vx.clear()
-        self.cursor_vy.clear()
-        self.target_x.clear()
-        self.target_y.clear()
-        self.error_x.clear()
-        self.error_y.clear()
-
-    def to_arrays(self) -> Dict[str, np.ndarray]:
-        """Convert to numpy arrays."""
-        return {
-            'timestamp': np.array(self.timestamps, dtype=np.float64),
-            'cursor_x': np.array(self.cursor_x, dtype=np.float64),
-            'cursor_y': np.array(self.cursor_y, dtype=np.float64),
-            'cursor_vx': np.array(self.cursor_vx, dtype=np.float64),
-            'cursor_vy': np.array(self.cursor_vy, dtype=np.float64),
-            'target_x': np.array(self.target_x, dtype=np.float64),
-            'target_y': np.array(self.target_y, dtype=np.float64),
-            'error_x': np.array(self.error_x, dtype=np.float64),
-            'error_y': np.array(self.error_y, dtype=np.float64),
+        """Clear all data (buffer is kept for reuse)."""
+        self._n = 0
+
+    def duration_s(self) -> float:
+        """Time between first and last sample in seconds."""
+        if self._n == 0:
+            return 0.0
+        return (self._data[0, self._n - 1] - self._data[0, 0]) / 1e6
+
+    def errors(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Tracking error (cursor - target) for X and Y axes."""
+        return self.cursor_x - self.target_x, self.cursor_y - self.target_y
+
+    def to_arrays(self, copy: bool = True) -> Dict[str, np.ndarray]:
+        """
+        Convert to numpy arrays.
+
+        With copy=False the buffer columns are returned as views, which are
+        only valid until the next clear()/append().
+        """
+        arrays = {
+            name: self._data[i, :self._n].copy() if copy else self._data[i, :self._n]
+            for i, name in enumerate(TRIAL_COLUMNS)
         }
+        arrays['error_x'], arrays['error_y'] = self.errors()
+        return arrays
 
     def compute_rmse(self) -> tuple:
         """Compute RMSE for X and Y axes."""
-        if not self.error_x:
+        if self._n == 0:
             return 0.0, 0.0, 0.0
-        ex = np.array(self.error_x)
-        ey = np.array(self.error_y)
-        rmse_x = np.sqrt(np.mean(ex**2))
-        rmse_y = np.sqrt(np.mean(ey**2))
-        rmse_total = np.sqrt(np.mean(ex**2 + ey**2))
+        ex, ey = self.errors()
+        # Sums of squares via dot products (one pass each, no temporaries)
+        sx = np.dot(ex, ex)
+        sy = np.dot(ey, ey)
+        rmse_x = np.sqrt(sx / self._n)
+        rmse_y = np.sqrt(sy / self._n)
+        rmse_total = np.sqrt((sx + sy) / self._n)
         return rmse_x, rmse_y, rmse_total
 
 
@@ -86,15 +147,40 @@ class HDF5Writer:
         self,
         output_dir: str = "./data",
         subject_id: str = "unknown",
-        task_type: str = "sos"
+        task_type: str = "sos",
+        compression: Optional[str] = "lzf",
+        flush_interval: float = 2.0,
+        max_pending_trials: int = 10,
+        chunk_size: int = 8192,
+        layout: str = "trial"
     ):
-        """Initialize HDF5 writer."""
+        """
+        Initialize HDF5 writer.
+
+        compression: 'lzf' (default), 'gzip', 'blosc' (requires hdf5plugin)
+        or None for uncompressed timeseries.
+        flush_interval / max_pending_trials: flush the file at most every
+        flush_interval seconds, or once this many trials are unflushed.
+        chunk_size: HDF5 chunk length (samples) for timeseries datasets;
+        shorter trials are stored as a single chunk.
+        layout: 'trial' writes trials/trial_NNN/timeseries/<column>;
+        'columnar' appends every trial to one dataset per column under
+        columns/ (plus a trial_id column) for fast selective reads.
+        """
+        if layout not in ('trial', 'columnar'):
+            raise ValueError(f"Unknown layout: {layout}")
+
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
         self.subject_id = subject_id
         self.task_type = task_type
 
+        # Dataset filter options (resolved once, reused for every column)
+        self._compression_kwargs = self._resolve_compression(compression)
+        self.chunk_size = chunk_size
+        self.layout = layout
+
         # Current file and trial
         self.file: Optional[h5py.File] = None
         self.filename: Optional[Path] = None
@@ -104,6 +190,25 @@ class HDF5Writer:
         # Recording state
         self.recording = False
 
+        # Flush policy
+        self.flush_interval = flush_interval
+        self.max_pending_trials = max_pending_trials
+        self._pending_trials = 0
+        self._last_flush = time.monotonic()
+
+    @staticmethod
+    def _resolve_compression(compression: Optional[str]) -> Dict[str, Any]:
+        """Map a compression name to create_dataset keyword arguments."""
+        if compression is None:
+            return {}
+        if compression == 'blosc':
+            if hdf5plugin is None:
+                raise ValueError("compression='blosc' requires the hdf5plugin package")
+            return dict(hdf5plugin.Blosc(
+                cname='lz4', clevel=5, shuffle=hdf5plugin.Blosc.SHUFFLE
+            ))
+        return {'compression': compression}
+
     def start_experiment(self, config: Optional[Dict[str, Any]] = None):
         """Start a new experiment file."""
         # Generate filename with timestamp
@@ -111,7 +216,7 @@ class HDF5Writer:
         self.filename = self.output_dir / f"experiment_{timestamp}.h5"
 
         # Create HDF5 file
-        self.file = h5py.File(self.filename, 'w')
+        self.file = h5py.File(self.filename, 'w', libver='latest')
 
         # Write metadata
         meta = self.file.create_group('metadata')
@@ -125,7 +230,20 @@ class HDF5Writer:
         # Create trials group
         self.file.create_group('trials')
 
+        # Columnar layout: one growable dataset per column across trials
+        if self.layout == 'columnar':
+            columns = self.file.create_group('columns')
+            for name in TIMESERIES_COLUMNS + ('trial_id',):
+                columns.create_dataset(
+                    name, shape=(0,), maxshape=(None,),
+                    dtype=np.uint32 if name == 'trial_id' else np.float64,
+                    chunks=(self.chunk_size,),
+                    **self._compression_kwargs, **_DATASET_OPTIONS
+                )
+
         self.trial_number = 0
+        self._pending_trials = 0
+        self._last_flush = time.monotonic()
         print(f"HDF5: Started experiment -> {self.filename}")
 
     def start_trial(self, parameters: Optional[Dict[str, float]] = None):
@@ -144,6 +262,51 @@ class HDF5Writer:
         if self.recording:
             self.trial_data.append(msg)
 
+    def _write_column(self, group: h5py.Group, name: str, data: np.ndarray):
+        """Write one timeseries column as a chunked dataset."""
+        if len(data) == 0:
+            group.create_dataset(
+                name, data=data, **self._compression_kwargs, **_DATASET_OPTIONS
+            )
+            return
+
+        chunk = min(len(data), self.chunk_size)
+        if self._compression_kwargs:
+            group.create_dataset(
+                name, data=data, chunks=(chunk,),
+                **self._compression_kwargs, **_DATASET_OPTIONS
+            )
+            return
+
+        # Uncompressed: write raw chunks directly, bypassing the filter pipeline
+        ds = group.create_dataset(
+            name, shape=data.shape, dtype=data.dtype, chunks=(chunk,),
+            **_DATASET_OPTIONS
+        )
+        for start in range(0, len(data), chunk):
+            block = data[start:start + chunk]
+            if len(block) < chunk:
+                # Chunks are always stored full-size
+                block = np.concatenate([block, np.zeros(chunk - len(block), data.dtype)])
+            ds.id.write_direct_chunk((start,), block.tobytes())
+
+    def _append_columns(self, arrays: Dict[str, np.ndarray]) -> int:
+        """Append a trial to the columnar datasets; returns its row offset."""
+        columns = self.file['columns']
+        n = len(self.trial_data)
+        offset = columns['trial_id'].shape[0]
+        arrays = dict(arrays, trial_id=np.full(n, self.trial_number, dtype=np.uint32))
+        for name, data in arrays.items():
+            ds = columns[name]
+            ds.resize((offset + n,))
+            ds[offset:] = data
+        return offset
+
+    def record_batch(self, records: np.ndarray):
+        """Record a batch of MESSAGE_DTYPE records to current trial."""
+        if self.recording:
+            self.trial_data.extend(records)
+
     def end_trial(self, success: bool = True, extra_metrics: Optional[Dict] = None):
         """End current trial and write to HDF5."""
         if not self.recording or self.file is None:
@@ -160,10 +323,13 @@ class HDF5Writer:
         trial_group.attrs['success'] = success
 
         # Write timeseries
-        ts_group = trial_group.create_group('timeseries')
-        arrays = self.trial_data.to_arrays()
-        for name, data in arrays.items():
-            ts_group.create_dataset(name, data=data, compression='gzip')
+        arrays = self.trial_data.to_arrays(copy=False)  # Written before clear()
+        if self.layout == 'columnar':
+            trial_group.attrs['columns_offset'] = self._append_columns(arrays)
+        else:
+            ts_group = trial_group.create_group('timeseries')
+            for name, data in arrays.items():
+                self._write_column(ts_group, name, data)
 
         # Write summary
         summary = trial_group.create_group('summary')
@@ -171,21 +337,30 @@ class HDF5Writer:
         summary.attrs['rmse_x'] = rmse_x
         summary.attrs['rmse_y'] = rmse_y
         summary.attrs['rmse_total'] = rmse_total
-        summary.attrs['sample_count'] = len(self.trial_data.timestamps)
+        summary.attrs['sample_count'] = len(self.trial_data)
 
-        if self.trial_data.timestamps:
-            duration = (self.trial_data.timestamps[-1] - self.trial_data.timestamps[0]) / 1e6
-            summary.attrs['duration_s'] = duration
+        if len(self.trial_data):
+            summary.attrs['duration_s'] = self.trial_data.duration_s()
 
         if extra_metrics:
             for k, v in extra_metrics.items():
                 summary.attrs[k] = v
 
-        # Flush to disk
-        self.file.flush()
+        # Flush to disk (batched across trials)
+        self._pending_trials += 1
+        if (self._pending_trials >= self.max_pending_trials or
+                time.monotonic() - self._last_flush >= self.flush_interval):
+            self.flush()
 
         print(f"HDF5: Ended trial {self.trial_number} (RMSE: {rmse_total*1000:.2f}mm)")
 
+    def flush(self):
+        """Flush pending trials to disk."""
+        if self.file is not None:
+            self.file.flush()
+        self._pending_trials = 0
+        self._last_flush = time.monotonic()
+
     def end_experiment(self):
         """End experiment and close file."""
         if self.file is not None:
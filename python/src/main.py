@@ -9,14 +9,19 @@ import time
 import argparse
 from typing import Optional
 
+import numpy as np
+
 from .network import UDPReceiver
 from .network.protocol import UDPMessage, TaskState
-from .visualization import Renderer
+from .visualization import Renderer, RenderConfig
 from .data import HDF5Writer, CSVWriter
 
 
 __version__ = "0.2.0"
 
+# Receive ring size when logging: ~2 s of samples at the 1 kHz send rate
+RECORD_QUEUE_SIZE = 2048
+
 
 class ExperimentRecorder:
     """Manages experiment recording with trial detection."""
@@ -66,34 +71,68 @@ class ExperimentRecorder:
 
     def process(self, msg: UDPMessage):
         """Process a message and manage trial state."""
+        self._update_state(msg.task_state, msg.trial_number)
+
+        # Record data
+        if msg.task_state == TaskState.RUNNING and self.hdf5 and self.trial_active:
+            self.hdf5.record(msg)
+            self.sample_count += 1
+
+    def process_batch(self, records: np.ndarray):
+        """
+        Process a batch of MESSAGE_DTYPE records (see UDPReceiver.drain).
+
+        The batch is split into runs of constant (task_state, trial_number);
+        each run updates trial state once and is recorded in one call.
+        """
+        if len(records) == 0:
+            return
+
+        states = records['task_state']
+        trials = records['trial_number']
+        changes = np.flatnonzero((states[1:] != states[:-1]) | (trials[1:] != trials[:-1]))
+        bounds = [0, *(changes + 1).tolist(), len(records)]
+
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            run = records[start:end]
+            try:
+                state = TaskState(int(states[start]))
+            except ValueError:
+                # Invalid state (same as a message that fails to parse)
+                continue
+
+            self._update_state(state, int(trials[start]))
+
+            # Record data
+            if state == TaskState.RUNNING and self.hdf5 and self.trial_active:
+                self.hdf5.record_batch(run)
+                self.sample_count += len(run)
+
+    def _update_state(self, task_state: TaskState, trial_number: int):
+        """Start/end trials on task state transitions."""
         # Detect trial start
-        if msg.task_state == TaskState.RUNNING:
-            if not self.trial_active or msg.trial_number != self.current_trial:
+        if task_state == TaskState.RUNNING:
+            if not self.trial_active or trial_number != self.current_trial:
                 # New trial started
                 if self.trial_active:
                     # End previous trial first
                     self._end_trial(success=True)
 
-                self._start_trial(msg.trial_number)
-
-            # Record data
-            if self.hdf5 and self.trial_active:
-                self.hdf5.record(msg)
-                self.sample_count += 1
+                self._start_trial(trial_number)
 
         # Detect trial end
         elif self.trial_active:
-            if msg.task_state == TaskState.COMPLETED:
+            if task_state == TaskState.COMPLETED:
                 self._end_trial(success=True)
-            elif msg.task_state == TaskState.FAILED:
+            elif task_state == TaskState.FAILED:
                 self._end_trial(success=False)
-            elif msg.task_state == TaskState.PAUSED:
+            elif task_state == TaskState.PAUSED:
                 # Pause doesn't end trial, just stop recording
                 pass
 
         # Update state
-        self.current_state = msg.task_state
-        self.current_trial = msg.trial_number
+        self.current_state = task_state
+        self.current_trial = trial_number
 
     def _start_trial(self, trial_number: int):
         """Start a new trial."""
@@ -114,10 +153,7 @@ class ExperimentRecorder:
         # Get metrics from HDF5 writer
         if self.hdf5:
             rmse_x, rmse_y, rmse_total = self.hdf5.trial_data.compute_rmse()
-            duration = 0.0
-            if self.hdf5.trial_data.timestamps:
-                ts = self.hdf5.trial_data.timestamps
-                duration = (ts[-1] - ts[0]) / 1e6
+            duration = self.hdf5.trial_data.duration_s()
 
             self.hdf5.end_trial(success=success)
 
@@ -198,7 +234,6 @@ def main():
     print()
 
     # Create renderer
-    from .visualization.renderer import RenderConfig
     config = RenderConfig(
         width=args.width,
         height=args.height,
@@ -208,7 +243,12 @@ def main():
     renderer = Renderer(config)
 
     # Create UDP receiver
-    receiver = UDPReceiver(port=args.port)
+    # When logging, every sample goes through the ring, so it must absorb
+    # main-thread stalls (trial close, hidden-window waits) at 1 kHz
+    receiver = UDPReceiver(
+        port=args.port,
+        queue_size=RECORD_QUEUE_SIZE if args.log else 100
+    )
 
     # Create recorder if logging enabled
     recorder: Optional[ExperimentRecorder] = None
@@ -255,20 +295,17 @@ def main():
 
         # Main loop
         frame_count = 0
-        last_stats_time = time.time()
-        msg_count = 0
+        last_stats_time = time.monotonic()
+        last_receive_count = receiver.receive_count
 
         while renderer.running:
+            # Record every message received since last frame
+            if recorder:
+                recorder.process_batch(receiver.drain())
+
             # Get latest message
             msg = receiver.get_latest()
 
-            if msg:
-                msg_count += 1
-
-                # Record if logging enabled
-                if recorder:
-                    recorder.process(msg)
-
             # Update display
             if not renderer.update(msg):
                 break
@@ -276,19 +313,21 @@ def main():
             frame_count += 1
 
             # Print stats every 5 seconds
-            now = time.time()
+            now = time.monotonic()
             if now - last_stats_time >= 5.0:
                 fps = frame_count / (now - last_stats_time)
-                rate = msg_count / (now - last_stats_time)
+                rate = (receiver.receive_count - last_receive_count) / (now - last_stats_time)
 
                 status = f"FPS: {fps:.1f} | UDP: {rate:.0f} Hz"
+                if receiver.dropped_count:
+                    status += f" | Dropped: {receiver.dropped_count}"
                 if recorder and recorder.trial_active:
                     status += f" | Trial {recorder.current_trial} [{recorder.sample_count}]"
 
                 print(status)
 
                 frame_count = 0
-                msg_count = 0
+                last_receive_count = receiver.receive_count
                 last_stats_time = now
 
     except KeyboardInterrupt:
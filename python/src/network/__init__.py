@@ -2,7 +2,9 @@
 UHTP Network Module - UDP communication.
 """
 
-from .protocol import UDPMessage, TaskState, MESSAGE_SIZE
+from .protocol import UDPMessage, TaskState, MESSAGE_SIZE, MESSAGE_DTYPE
 from .udp_receiver import UDPReceiver
 
-__all__ = ['UDPMessage', 'TaskState', 'MESSAGE_SIZE', 'UDPReceiver']
+__all__ = [
+    'UDPMessage', 'TaskState', 'MESSAGE_SIZE', 'MESSAGE_DTYPE', 'UDPReceiver'
+]
@@ -16,7 +16,9 @@ Binary format (little-endian, 64 bytes total):
 import struct
 from dataclasses import dataclass
 from enum import IntEnum
-from typing import Optional
+from typing import Optional, Union
+
+import numpy as np
 
 
 class TaskState(IntEnum):
@@ -28,8 +30,26 @@ class TaskState(IntEnum):
     FAILED = 4
 
 
+# Value -> member lookup (avoids the TaskState() constructor per message)
+_TASK_STATES = {state.value: state for state in TaskState}
+
 MESSAGE_SIZE = 64
 MESSAGE_FORMAT = '<dddddddII'  # little-endian: 7 doubles + 2 uint32
+_MESSAGE_STRUCT = struct.Struct(MESSAGE_FORMAT)
+
+# Same layout as a NumPy record, for zero-copy parsing of many messages
+MESSAGE_DTYPE = np.dtype([
+    ('timestamp_us', '<f8'),
+    ('cursor_x', '<f8'),
+    ('cursor_y', '<f8'),
+    ('cursor_vx', '<f8'),
+    ('cursor_vy', '<f8'),
+    ('target_x', '<f8'),
+    ('target_y', '<f8'),
+    ('task_state', '<u4'),
+    ('trial_number', '<u4'),
+])
+assert MESSAGE_DTYPE.itemsize == MESSAGE_SIZE
 
 
 @dataclass
@@ -46,13 +66,15 @@ class UDPMessage:
     trial_number: int
 
     @classmethod
-    def from_bytes(cls, data: bytes) -> Optional['UDPMessage']:
-        """Parse UDP message from bytes."""
+    def from_bytes(
+        cls, data: Union[bytes, bytearray, memoryview]
+    ) -> Optional['UDPMessage']:
+        """Parse UDP message from bytes (or any buffer, without copying)."""
         if len(data) < MESSAGE_SIZE:
             return None
 
         try:
-            values = struct.unpack(MESSAGE_FORMAT, data[:MESSAGE_SIZE])
+            values = _MESSAGE_STRUCT.unpack_from(data, 0)
             return cls(
                 timestamp_us=values[0],
                 cursor_x=values[1],
@@ -61,16 +83,24 @@ class UDPMessage:
                 cursor_vy=values[4],
                 target_x=values[5],
                 target_y=values[6],
-                task_state=TaskState(values[7]),
+                task_state=_TASK_STATES[values[7]],
                 trial_number=values[8]
             )
-        except (struct.error, ValueError):
+        except (struct.error, KeyError):
+            return None
+
+    @classmethod
+    def from_record(cls, rec) -> Optional['UDPMessage']:
+        """Build a message from one MESSAGE_DTYPE record."""
+        values = rec.item()
+        try:
+            return cls(*values[:7], _TASK_STATES[values[7]], values[8])
+        except KeyError:
             return None
 
     def to_bytes(self) -> bytes:
         """Serialize message to bytes."""
-        return struct.pack(
-            MESSAGE_FORMAT,
+        return _MESSAGE_STRUCT.pack(
             self.timestamp_us,
             self.cursor_x,
             self.cursor_y,
@@ -4,49 +4,108 @@ UDP Receiver for UHTP
 Receives state updates from Julia Core.
 """
 
+import select
 import socket
+import sys
 import threading
 from typing import Optional, Callable
-from collections import deque
 
-from .protocol import UDPMessage, MESSAGE_SIZE
+import numpy as np
+
+from .protocol import UDPMessage, MESSAGE_SIZE, MESSAGE_DTYPE
 
 
 class UDPReceiver:
     """
     Non-blocking UDP receiver with message queue.
+
+    The queue is a single-producer/single-consumer ring of MESSAGE_DTYPE
+    records: the receive thread only advances _write_idx and the consumer
+    only advances _read_idx, so neither side takes a lock.
     """
 
     def __init__(
         self,
         port: int = 12345,
         host: str = "127.0.0.1",
-        queue_size: int = 100
+        queue_size: int = 100,
+        batch_size: int = 64,
+        poll_timeout: float = 0.1,
+        rcvbuf: int = 1 << 23
     ):
-        """Initialize UDP receiver."""
+        """
+        Initialize UDP receiver.
+
+        queue_size: ring capacity (rounded up to a power of two).
+        batch_size: max datagrams drained per wakeup of the receive thread.
+        poll_timeout: seconds the receive thread blocks waiting for data.
+        rcvbuf: requested kernel receive buffer size in bytes (absorbs
+        bursts while the viewer is stalled, e.g. at trial close).
+        """
         self.port = port
         self.host = host
-        self.queue_size = queue_size
+        self.queue_size = 1 << max(queue_size - 1, 1).bit_length()
+        self.batch_size = batch_size
+        self.poll_timeout = poll_timeout
 
         # Socket
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._set_rcvbuf(rcvbuf)
         self.socket.bind((host, port))
         self.socket.setblocking(False)
 
-        # Message queue (thread-safe)
-        self._queue: deque[UDPMessage] = deque(maxlen=queue_size)
-        self._lock = threading.Lock()
+        # Message queue: datagrams are received straight into ring slots
+        self._ring = np.zeros(self.queue_size, dtype=MESSAGE_DTYPE)
+        ring_bytes = memoryview(self._ring.view(np.uint8))
+        self._slots = [
+            ring_bytes[i * MESSAGE_SIZE:(i + 1) * MESSAGE_SIZE]
+            for i in range(self.queue_size)
+        ]  # Prebuilt per-slot views: no allocation per datagram
+        self._mask = self.queue_size - 1
+        self._write_idx = 0  # Producer (receive thread) only
+        self._read_idx = 0   # Consumer only
 
         # Statistics
         self.receive_count = 0
         self.error_count = 0
-        self.last_message: Optional[UDPMessage] = None
+        self.dropped_count = 0  # Records overwritten before being read
+
+        # Consumer-side cache of the decoded latest message
+        self._latest: Optional[UDPMessage] = None
+        self._latest_idx = 0
 
         # Receiver thread
         self._running = False
         self._thread: Optional[threading.Thread] = None
 
+    def _set_rcvbuf(self, size: int) -> None:
+        """Enlarge the kernel receive buffer, warning if it gets capped."""
+        # SO_RCVBUFFORCE (Linux) ignores rmem_max but needs CAP_NET_ADMIN
+        force = getattr(socket, 'SO_RCVBUFFORCE', None)
+        try:
+            if force is None:
+                raise OSError
+            self.socket.setsockopt(socket.SOL_SOCKET, force, size)
+        except OSError:
+            # macOS rejects sizes above kern.ipc.maxsockbuf (ENOBUFS):
+            # halve until accepted, else keep the default
+            request = size
+            while request >= 1 << 16:
+                try:
+                    self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, request)
+                    break
+                except OSError:
+                    request //= 2
+
+        # Linux reports double the granted size (bookkeeping overhead)
+        actual = self.socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+        expected = 2 * size if sys.platform.startswith('linux') else size
+        if actual < expected:
+            print(f"UDP: Warning: receive buffer capped at {actual} bytes "
+                  f"(requested {size}); raise the OS socket buffer limit "
+                  f"(net.core.rmem_max on Linux, kern.ipc.maxsockbuf on macOS)")
+
     def start(self) -> None:
         """Start receiver thread."""
         if self._running:
@@ -67,30 +126,65 @@ class UDPReceiver:
         """Background receive loop."""
         while self._running:
             try:
-                data, addr = self.socket.recvfrom(MESSAGE_SIZE + 64)
-                msg = UDPMessage.from_bytes(data)
-                if msg:
-                    with self._lock:
-                        self._queue.append(msg)
-                        self.last_message = msg
-                    self.receive_count += 1
-            except BlockingIOError:
-                # No data available
-                pass
+                ready, _, _ = select.select([self.socket], [], [], self.poll_timeout)
+                if ready:
+                    self._receive_batch()
             except Exception:
                 self.error_count += 1
 
+    def _receive_batch(self) -> None:
+        """Drain up to batch_size pending datagrams into the ring."""
+        for _ in range(self.batch_size):
+            try:
+                nbytes = self.socket.recv_into(self._slots[self._write_idx & self._mask])
+            except BlockingIOError:
+                # No more data available
+                break
+            if nbytes == MESSAGE_SIZE:
+                # Publish the slot only after it is fully written
+                self._write_idx += 1
+                self.receive_count += 1
+
+    def _read(self, max_n: Optional[int] = None) -> np.ndarray:
+        """Copy unread records out of the ring and advance _read_idx."""
+        end = self._write_idx
+        start = max(self._read_idx, end - self.queue_size)
+        if max_n is not None:
+            end = min(end, start + max_n)
+        records = self._ring[np.arange(start, end) & self._mask]
+
+        # Drop records the producer may have overwritten while copying
+        # (the slot at the current _write_idx may be mid-write)
+        overwritten = self._write_idx - self.queue_size + 1 - start
+        if overwritten > 0:
+            records = records[overwritten:]
+        self.dropped_count += start - self._read_idx + max(overwritten, 0)
+        self._read_idx = end
+        return records
+
+    @property
+    def last_message(self) -> Optional[UDPMessage]:
+        """Most recent message (decoded lazily by the consumer)."""
+        return self.get_latest()
+
     def get_latest(self) -> Optional[UDPMessage]:
         """Get the most recent message (non-blocking)."""
-        with self._lock:
-            return self.last_message
+        idx = self._write_idx
+        if idx != self._latest_idx:
+            msg = UDPMessage.from_record(self._ring[(idx - 1) & self._mask])
+            if msg:
+                self._latest = msg
+            self._latest_idx = idx
+        return self._latest
+
+    def drain(self, max_n: Optional[int] = None) -> np.ndarray:
+        """Get up to max_n queued messages as MESSAGE_DTYPE records."""
+        return self._read(max_n)
 
     def get_all(self) -> list[UDPMessage]:
         """Get all queued messages and clear queue."""
-        with self._lock:
-            messages = list(self._queue)
-            self._queue.clear()
-            return messages
+        messages = (UDPMessage.from_record(rec) for rec in self._read())
+        return [msg for msg in messages if msg]
 
     def close(self) -> None:
         """Close receiver and socket."""
@@ -2,6 +2,6 @@
 UHTP Visualization Module - PyGame renderer.
 """
 
-from .renderer import Renderer
+from .renderer import Renderer, RenderConfig
 
-__all__ = ['Renderer']
+__all__ = ['Renderer', 'RenderConfig']
@@ -4,21 +4,94 @@ PyGame Renderer for UHTP
 60Hz visualization of cursor and target with task-specific features.
 """
 
+import math
+import time
 import pygame
+import pygame.gfxdraw
 import numpy as np
 from typing import Optional, List
 from dataclasses import dataclass, field
-from collections import deque
+from collections import OrderedDict
 
 from ..network.protocol import UDPMessage, TaskState
 
+# Number of color steps used to fade the trajectory trace
+TRACE_FADE_STEPS = 8
 
-@dataclass
+# Max number of rendered text surfaces kept for reuse
+TEXT_CACHE_SIZE = 64
+
+# Window visibility events: hidden/minimized stops drawing until shown again
+HIDE_EVENTS = (pygame.WINDOWHIDDEN, pygame.WINDOWMINIMIZED)
+SHOW_EVENTS = (pygame.WINDOWSHOWN, pygame.WINDOWRESTORED)
+# Contents invalidated while visible (e.g. uncovered without compositing)
+REDRAW_EVENTS = (*SHOW_EVENTS, pygame.WINDOWEXPOSED)
+
+# Only event types the renderer handles are queued (others are blocked)
+EVENT_TYPES = [pygame.QUIT, pygame.KEYDOWN, *HIDE_EVENTS, *REDRAW_EVENTS]
+
+# Event wait timeout while the window is hidden (ms)
+HIDDEN_WAIT_MS = 100
+
+# With precise_timing, sleep until this long before the frame deadline,
+# then yield-spin the rest (s)
+SPIN_MARGIN_S = 0.002
+
+
+def _mm(meters: float) -> float:
+    """
+    Convert meters to millimeters in 0.5mm steps (for display), so cached
+    text surfaces are reused while the cursor barely moves.
+    """
+    return round(meters * 2000) / 2
+
+
+class _RingBuffer:
+    """Fixed-size FIFO of float samples backed by a preallocated array."""
+
+    def __init__(self, capacity: int, width: Optional[int] = None):
+        shape = (capacity,) if width is None else (capacity, width)
+        self._data = np.empty(shape, dtype=np.float64)
+        self._head = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, value) -> Optional[float]:
+        """
+        Append a sample, overwriting the oldest one when full.
+        Returns the evicted scalar sample, or None if nothing was evicted.
+        """
+        evicted = None
+        if self._count == len(self._data) and self._data.ndim == 1:
+            evicted = float(self._data[self._head])
+        self._data[self._head] = value
+        self._head = (self._head + 1) % len(self._data)
+        if self._count < len(self._data):
+            self._count += 1
+        return evicted
+
+    def clear(self) -> None:
+        self._head = 0
+        self._count = 0
+
+    def view(self) -> np.ndarray:
+        """Samples oldest-first (a view until the buffer wraps)."""
+        if self._count < len(self._data):
+            return self._data[:self._count]
+        return np.concatenate((self._data[self._head:], self._data[:self._head]))
+
+
+@dataclass(frozen=True)
 class RenderConfig:
-    """Renderer configuration."""
+    """Renderer configuration (immutable; runtime toggles live on Renderer)."""
     width: int = 1280
     height: int = 720
     fps: int = 60
+    # Yield-spin the last ~2 ms of each frame for sub-ms pacing; disable to
+    # save power (falls back to the coarser SDL_Delay-based tick)
+    precise_timing: bool = True
     background_color: tuple = (20, 20, 30)
     cursor_color: tuple = (0, 200, 255)
     target_color: tuple = (255, 100, 100)
@@ -49,24 +122,70 @@ class Renderer:
         self.config = config or RenderConfig()
         self.screen: Optional[pygame.Surface] = None
         self.clock: Optional[pygame.time.Clock] = None
+        self._last_tick = 0.0  # perf_counter() at the end of the last frame
         self.font: Optional[pygame.font.Font] = None
         self.small_font: Optional[pygame.font.Font] = None
         self.running = False
 
+        # Hot config values bound once (read on every draw)
+        self._origin_x = self.config.origin_x
+        self._origin_y = self.config.origin_y
+        self._scale = self.config.scale
+        self._width = self.config.width
+        self._height = self.config.height
+
+        # Display toggles (keyboard)
+        self.show_trace = self.config.show_trace
+        self.show_plot = self.config.show_plot
+
         # Current state for rendering
         self.last_message: Optional[UDPMessage] = None
+        self._last_error_mm = 0.0
+        self._last_message_key: Optional[tuple] = None  # Content last drawn
 
         # Trajectory trace
-        self.trace: deque = deque(maxlen=self.config.trace_length)
+        self.trace = _RingBuffer(self.config.trace_length, 2)
 
         # Error history for plot
-        self.error_history: deque = deque(maxlen=300)  # 5 seconds at 60Hz
-        self.time_history: deque = deque(maxlen=300)
+        self.error_history = _RingBuffer(300)  # 5 seconds at 60Hz
+        self._max_error_mm = 0.0  # Running max of error_history
+        self.time_history = _RingBuffer(300)
 
         # Fitts targets (for visualization)
         self.fitts_targets: List[tuple] = []
+        self._fitts_screen: List[tuple] = []
         self._init_fitts_targets()
 
+        # Grid line positions in pixels (every 10cm, on-screen only)
+        self._vgrid_xs = [
+            x for x in (self._origin_x + int(i * 0.1 * self._scale)
+                        for i in range(-10, 11))
+            if 0 <= x <= self._width
+        ]
+        self._hgrid_ys = [
+            y for y in (self._origin_y - int(i * 0.1 * self._scale)
+                        for i in range(-5, 6))
+            if 0 <= y <= self._height
+        ]
+
+        # Dirty-rect rendering: static background and last frame's regions
+        self._bg: Optional[pygame.Surface] = None
+        self._prev_dirty: List[pygame.Rect] = []
+        self._full_redraw = True
+        self._state_dirty = True  # Something changed since last render
+        self._visible = True  # False while the window is hidden/minimized
+
+        # Rendered text surfaces, keyed by (font, text, color), LRU order
+        self._text_cache: OrderedDict = OrderedDict()
+        self._help_text: Optional[pygame.Surface] = None
+
+        # Keyboard shortcuts (ESC is handled with QUIT)
+        self._key_actions = {
+            pygame.K_t: self._toggle_trace,
+            pygame.K_p: self._toggle_plot,
+            pygame.K_c: self._clear_trace,
+        }
+
     def _init_fitts_targets(self, num_targets=13, radius=0.08):
         """Pre-compute Fitts target positions."""
         self.fitts_targets = []
@@ -75,6 +194,7 @@ class Renderer:
             x = radius * np.cos(angle)
             y = radius * np.sin(angle)
             self.fitts_targets.append((x, y))
+        self._fitts_screen = [self.world_to_screen(x, y) for x, y in self.fitts_targets]
 
     def init(self) -> bool:
         """Initialize PyGame and create window."""
@@ -85,9 +205,17 @@ class Renderer:
             self.screen = pygame.display.set_mode(
                 (self.config.width, self.config.height)
             )
+            pygame.event.set_blocked(None)
+            pygame.event.set_allowed(EVENT_TYPES)
             self.clock = pygame.time.Clock()
             self.font = pygame.font.SysFont('monospace', 16)
             self.small_font = pygame.font.SysFont('monospace', 12)
+            self._help_text = self.small_font.render(
+                "T:trace  P:plot  C:clear  ESC:quit", True, (100, 100, 100)
+            ).convert_alpha()
+
+            self._build_static_bg()
+            self._full_redraw = True
 
             self.running = True
             return True
@@ -97,175 +225,275 @@ class Renderer:
 
     def world_to_screen(self, x: float, y: float) -> tuple:
         """Convert world coordinates (meters) to screen coordinates (pixels)."""
-        sx = int(self.config.origin_x + x * self.config.scale)
-        sy = int(self.config.origin_y - y * self.config.scale)  # Y is inverted
+        # floor(v + 0.5) rounds to the nearest pixel (int() truncates
+        # toward zero, which biases negative coordinates)
+        sx = math.floor(self._origin_x + x * self._scale + 0.5)
+        sy = math.floor(self._origin_y - y * self._scale + 0.5)  # Y is inverted
         return (sx, sy)
 
+    def world_to_screen_array(self, xy: np.ndarray) -> np.ndarray:
+        """Vectorized world_to_screen for an (N, 2) array of points."""
+        xy = np.asarray(xy, dtype=np.float64)
+        screen = np.empty(xy.shape, dtype=np.int32)
+        screen[:, 0] = np.floor(self._origin_x + xy[:, 0] * self._scale + 0.5)
+        screen[:, 1] = np.floor(self._origin_y - xy[:, 1] * self._scale + 0.5)  # Y is inverted
+        return screen
+
     def update(self, message: Optional[UDPMessage]) -> bool:
         """
         Update display with new message.
         Returns False if window should close.
+
+        Frame order is render -> present -> wait for next frame -> poll
+        input, so input is handled right before the frame it affects
+        instead of one frame earlier. When nothing changed (no message with
+        new content, no toggle) the frame is skipped and the thread sleeps
+        in pygame.event.wait() until input arrives or a frame period passes.
         """
         if not self.running or not self.screen:
             return False
 
-        # Handle events
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-                return False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    self.running = False
-                    return False
-                elif event.key == pygame.K_t:
-                    # Toggle trace
-                    self.config.show_trace = not self.config.show_trace
-                elif event.key == pygame.K_p:
-                    # Toggle plot
-                    self.config.show_plot = not self.config.show_plot
-                elif event.key == pygame.K_c:
-                    # Clear trace
-                    self.trace.clear()
-
         # Store message and update history
-        if message:
+        if message and message is not self.last_message:
             self.last_message = message
+            key = (
+                message.cursor_x, message.cursor_y,
+                message.target_x, message.target_y,
+                message.task_state, message.trial_number,
+            )
+            if key != self._last_message_key:
+                self._last_message_key = key
+                self._state_dirty = True
+                self._append_history(message)
+
+        if not self._visible:
+            # Hidden: keep history current but skip drawing entirely
+            event = pygame.event.wait(timeout=HIDDEN_WAIT_MS)
+            if event.type != pygame.NOEVENT and not self._handle_event(event):
+                return False
+            return self._poll_events()
 
-            # Update trace
-            if self.config.show_trace:
-                self.trace.append((message.cursor_x, message.cursor_y))
+        if not (self._state_dirty or self._full_redraw):
+            # Idle: block until input or one frame period elapses
+            event = pygame.event.wait(timeout=1000 // self.config.fps)
+            if event.type != pygame.NOEVENT and not self._handle_event(event):
+                return False
+            return self._poll_events()
 
-            # Update error history
-            error = np.sqrt(
-                (message.cursor_x - message.target_x)**2 +
-                (message.cursor_y - message.target_y)**2
-            )
-            self.error_history.append(error * 1000)  # Convert to mm
-            self.time_history.append(message.timestamp_us / 1e6)
+        self._render()
+        self._state_dirty = False
 
-        # Clear screen
-        self.screen.fill(self.config.background_color)
+        # Limit frame rate
+        if self.config.precise_timing:
+            self._wait_frame()
+        else:
+            self.clock.tick(self.config.fps)
 
-        # Draw grid
-        self._draw_grid()
+        return self._poll_events()
 
-        # Draw task-specific elements
-        if self.last_message:
-            self._draw_task_elements(self.last_message)
+    def _wait_frame(self) -> None:
+        """
+        Wait until one frame period has passed since the last frame.
+
+        Sleeps coarsely, then spins on time.sleep(0) up to the deadline.
+        Unlike Clock.tick_busy_loop (which spins in C holding the GIL),
+        this lets the UDP receive thread run throughout the wait.
+        """
+        deadline = self._last_tick + 1.0 / self.config.fps
+        remaining = deadline - time.perf_counter()
+        if remaining > SPIN_MARGIN_S:
+            time.sleep(remaining - SPIN_MARGIN_S)
+        while time.perf_counter() < deadline:
+            time.sleep(0)
+        self._last_tick = time.perf_counter()
+
+    def _append_history(self, message: UDPMessage) -> None:
+        """Add a message to the trace and error history."""
+        # Update trace
+        if self.show_trace:
+            self.trace.append((message.cursor_x, message.cursor_y))
+
+        # Update error history (error computed once per message)
+        self._last_error_mm = math.hypot(
+            message.cursor_x - message.target_x,
+            message.cursor_y - message.target_y
+        ) * 1000  # Convert to mm
+        evicted = self.error_history.append(self._last_error_mm)
+        if self._last_error_mm >= self._max_error_mm:
+            self._max_error_mm = self._last_error_mm
+        elif evicted == self._max_error_mm:
+            # The max left the window; rescan (rare for a noisy signal)
+            self._max_error_mm = float(self.error_history.view().max())
+        self.time_history.append(message.timestamp_us / 1e6)
+
+    def _poll_events(self) -> bool:
+        """Handle pending input. Returns False if window should close."""
+        # Unfiltered get() keeps queue order (a typed get groups events by
+        # type, which could reorder hide/show); other types are blocked
+        for event in pygame.event.get():
+            if not self._handle_event(event):
+                return False
+        return True
+
+    def _handle_event(self, event: pygame.event.Event) -> bool:
+        """Handle one input event. Returns False if window should close."""
+        if event.type in HIDE_EVENTS:
+            self._visible = False
+            return True
+        if event.type in REDRAW_EVENTS:
+            if event.type in SHOW_EVENTS:
+                self._visible = True
+            self._full_redraw = True  # Window contents may have been lost
+            return True
+        if event.type == pygame.QUIT:
+            self.running = False
+            return False
+        if event.type != pygame.KEYDOWN:
+            return True
+        if event.key == pygame.K_ESCAPE:
+            self.running = False
+            return False
+        action = self._key_actions.get(event.key)
+        if action:
+            action()
+            self._state_dirty = True
+        return True
+
+    def _render(self) -> None:
+        """Draw the current state and present it."""
+        # Restore background (whole screen, or only last frame's regions)
+        if self._full_redraw:
+            self.screen.blit(self._bg, (0, 0))
+        else:
+            for rect in self._prev_dirty:
+                self.screen.blit(self._bg, rect, rect)
+
+        dirty: List[pygame.Rect] = []
 
         # Draw trace
-        if self.config.show_trace and len(self.trace) > 1:
-            self._draw_trace()
+        if self.show_trace and len(self.trace) > 1:
+            dirty.append(self._draw_trace())
 
         # Draw target and cursor
         if self.last_message:
-            self._draw_target(self.last_message)
-            self._draw_cursor(self.last_message)
+            dirty.append(self._draw_target(self.last_message))
+            dirty.append(self._draw_cursor(self.last_message))
 
         # Draw error plot
-        if self.config.show_plot:
-            self._draw_error_plot()
+        if self.show_plot and len(self.error_history) > 1:
+            dirty.append(self._draw_error_plot())
 
         # Draw info overlay
         if self.last_message:
-            self._draw_info(self.last_message)
+            dirty.append(self._draw_info(self.last_message, self._last_error_mm))
 
         # Draw help
-        self._draw_help()
-
-        # Update display
-        pygame.display.flip()
+        dirty.append(self._draw_help())
+
+        # Update display (only regions that changed since last frame)
+        if self._full_redraw:
+            pygame.display.flip()
+            self._full_redraw = False
+        else:
+            pygame.display.update(self._prev_dirty + dirty)
+        self._prev_dirty = dirty
+
+    def _toggle_trace(self) -> None:
+        """Toggle trajectory trace."""
+        self.show_trace = not self.show_trace
+
+    def _toggle_plot(self) -> None:
+        """Toggle error plot."""
+        self.show_plot = not self.show_plot
+
+    def _clear_trace(self) -> None:
+        """Clear trajectory trace."""
+        self.trace.clear()
 
-        # Limit frame rate
-        self.clock.tick(self.config.fps)
+    def _build_static_bg(self) -> None:
+        """Pre-render static scenery (grid, axes, Fitts targets) once."""
+        # Same pixel format as the display, so blits are plain copies
+        self._bg = pygame.Surface((self._width, self._height)).convert()
+        self._bg.fill(self.config.background_color)
+        self._draw_grid(self._bg)
+        self._draw_task_elements(self._bg)
 
-        return True
-
-    def _draw_grid(self) -> None:
+    def _draw_grid(self, surface: pygame.Surface) -> None:
         """Draw coordinate grid."""
         grid_color = (50, 50, 60)
 
         # Vertical lines (every 10cm)
-        for i in range(-10, 11):
-            x = self.config.origin_x + int(i * 0.1 * self.config.scale)
-            if 0 <= x <= self.config.width:
-                pygame.draw.line(
-                    self.screen, grid_color,
-                    (x, 0), (x, self.config.height), 1
-                )
+        for x in self._vgrid_xs:
+            pygame.draw.line(
+                surface, grid_color,
+                (x, 0), (x, self._height), 1
+            )
 
         # Horizontal lines (every 10cm)
-        for i in range(-5, 6):
-            y = self.config.origin_y - int(i * 0.1 * self.config.scale)
-            if 0 <= y <= self.config.height:
-                pygame.draw.line(
-                    self.screen, grid_color,
-                    (0, y), (self.config.width, y), 1
-                )
+        for y in self._hgrid_ys:
+            pygame.draw.line(
+                surface, grid_color,
+                (0, y), (self._width, y), 1
+            )
 
         # Origin axes
         axis_color = (80, 80, 100)
         pygame.draw.line(
-            self.screen, axis_color,
-            (self.config.origin_x, 0), (self.config.origin_x, self.config.height), 2
+            surface, axis_color,
+            (self._origin_x, 0), (self._origin_x, self._height), 2
         )
         pygame.draw.line(
-            self.screen, axis_color,
-            (0, self.config.origin_y), (self.config.width, self.config.origin_y), 2
+            surface, axis_color,
+            (0, self._origin_y), (self._width, self._origin_y), 2
         )
 
-    def _draw_task_elements(self, msg: UDPMessage) -> None:
+    def _draw_task_elements(self, surface: pygame.Surface) -> None:
         """Draw task-specific elements."""
         # Draw all Fitts targets as faint circles
-        for tx, ty in self.fitts_targets:
-            pos = self.world_to_screen(tx, ty)
-            pygame.draw.circle(
-                self.screen,
-                (60, 60, 70),  # Faint color
-                pos,
-                8,
-                1
-            )
-
-    def _draw_trace(self) -> None:
-        """Draw cursor trajectory trace."""
-        if len(self.trace) < 2:
-            return
-
-        points = [self.world_to_screen(x, y) for x, y in self.trace]
-
-        # Draw with fading color
-        for i in range(len(points) - 1):
-            alpha = int(255 * (i + 1) / len(points))
+        for x, y in self._fitts_screen:
+            pygame.gfxdraw.aacircle(surface, x, y, 8, (60, 60, 70))  # Faint color
+
+    def _draw_trace(self) -> pygame.Rect:
+        """Draw cursor trajectory trace. Returns the affected area."""
+        points = self.world_to_screen_array(self.trace.view()).tolist()
+
+        # Draw with fading color: one polyline per fade step, not per segment
+        n = len(points)
+        bounds = np.linspace(0, n - 1, min(TRACE_FADE_STEPS, n - 1) + 1).astype(int)
+        rects = []
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            alpha = int(255 * end / n)
             color = (
                 min(255, self.config.trace_color[0] + alpha // 4),
                 min(255, self.config.trace_color[1] + alpha // 4),
                 min(255, self.config.trace_color[2] + alpha // 4)
             )
-            pygame.draw.line(self.screen, color, points[i], points[i + 1], 2)
-
-    def _draw_cursor(self, msg: UDPMessage) -> None:
-        """Draw cursor circle."""
-        pos = self.world_to_screen(msg.cursor_x, msg.cursor_y)
-        pygame.draw.circle(
-            self.screen,
-            self.config.cursor_color,
-            pos,
-            self.config.cursor_radius
-        )
-
-    def _draw_target(self, msg: UDPMessage) -> None:
-        """Draw target circle."""
+            rects.append(pygame.draw.lines(self.screen, color, False, points[start:end + 1], 2))
+        return rects[0].unionall(rects)
+
+    def _draw_cursor(self, msg: UDPMessage) -> pygame.Rect:
+        """Draw cursor circle. Returns the affected area."""
+        x, y = self.world_to_screen(msg.cursor_x, msg.cursor_y)
+        r = self.config.cursor_radius
+        area = pygame.Rect(x - r, y - r, 2 * r + 1, 2 * r + 1)
+        # gfxdraw takes 16-bit coordinates: skip shapes off the screen
+        if not area.colliderect(self.screen.get_rect()):
+            return pygame.Rect(0, 0, 0, 0)
+        pygame.gfxdraw.filled_circle(self.screen, x, y, r, self.config.cursor_color)
+        pygame.gfxdraw.aacircle(self.screen, x, y, r, self.config.cursor_color)
+        return area
+
+    def _draw_target(self, msg: UDPMessage) -> pygame.Rect:
+        """Draw target circle. Returns the affected area."""
         pos = self.world_to_screen(msg.target_x, msg.target_y)
-        # Draw target as ring
-        pygame.draw.circle(
-            self.screen,
-            self.config.target_color,
-            pos,
-            self.config.target_radius,
-            2  # Ring width
-        )
+        r = self.config.target_radius
+        area = pygame.Rect(pos[0] - r, pos[1] - r, 2 * r + 1, 2 * r + 1)
+        # gfxdraw takes 16-bit coordinates: skip shapes off the screen
+        if not area.colliderect(self.screen.get_rect()):
+            return pygame.Rect(0, 0, 0, 0)
+        # Draw target as anti-aliased ring (2px wide)
+        pygame.gfxdraw.aacircle(self.screen, pos[0], pos[1], r, self.config.target_color)
+        pygame.gfxdraw.aacircle(self.screen, pos[0], pos[1], r - 1, self.config.target_color)
         # Draw crosshair
         pygame.draw.line(
             self.screen, self.config.target_color,
@@ -275,20 +503,18 @@ class Renderer:
             self.screen, self.config.target_color,
             (pos[0], pos[1] - 8), (pos[0], pos[1] + 8), 1
         )
+        return area
 
-    def _draw_error_plot(self) -> None:
-        """Draw real-time error plot."""
-        if len(self.error_history) < 2:
-            return
-
+    def _draw_error_plot(self) -> pygame.Rect:
+        """Draw real-time error plot. Returns the affected area."""
         # Plot area (bottom right)
-        plot_x = self.config.width - self.config.plot_width - 10
-        plot_y = self.config.height - self.config.plot_height - 10
+        plot_x = self._width - self.config.plot_width - 10
+        plot_y = self._height - self.config.plot_height - 10
         plot_w = self.config.plot_width
         plot_h = self.config.plot_height
 
         # Draw background
-        pygame.draw.rect(
+        area = pygame.draw.rect(
             self.screen,
             (30, 30, 40),
             (plot_x, plot_y, plot_w, plot_h)
@@ -301,65 +527,78 @@ class Renderer:
         )
 
         # Title
-        title = self.small_font.render("Error (mm)", True, (200, 200, 200))
-        self.screen.blit(title, (plot_x + 5, plot_y + 2))
+        title = self._render_text("Error (mm)", self.small_font, (200, 200, 200))
+        area.union_ip(self.screen.blit(title, (plot_x + 5, plot_y + 2)))
 
         # Scale error to plot height
-        errors = list(self.error_history)
-        max_error = max(max(errors), 10)  # At least 10mm scale
+        errors = self.error_history.view()
+        n = len(errors)
+        max_error = max(self._max_error_mm, 10.0)  # At least 10mm scale
 
         # Draw Y axis labels
-        for val in [0, max_error / 2, max_error]:
-            y = plot_y + plot_h - 15 - int((val / max_error) * (plot_h - 20))
-            label = self.small_font.render(f"{val:.0f}", True, (150, 150, 150))
-            self.screen.blit(label, (plot_x + 5, y - 6))
+        label_vals = np.array([0.0, max_error / 2, max_error])
+        label_ys = plot_y + plot_h - 15 - (label_vals / max_error * (plot_h - 20)).astype(int)
+        for val, y in zip(label_vals.tolist(), label_ys.tolist()):
+            label = self._render_text(f"{val:.0f}", self.small_font, (150, 150, 150))
+            area.union_ip(self.screen.blit(label, (plot_x + 5, y - 6)))
 
         # Draw error line
-        points = []
-        for i, err in enumerate(errors):
-            x = plot_x + 30 + int(i * (plot_w - 35) / len(errors))
-            y = plot_y + plot_h - 5 - int((err / max_error) * (plot_h - 20))
-            points.append((x, y))
+        xs = plot_x + 30 + (np.arange(n) * (plot_w - 35) / n).astype(int)
+        ys = plot_y + plot_h - 5 - (errors / max_error * (plot_h - 20)).astype(int)
+        points = np.column_stack((xs, ys)).tolist()
 
         if len(points) > 1:
-            pygame.draw.lines(self.screen, (255, 150, 50), False, points, 2)
+            area.union_ip(pygame.draw.lines(self.screen, (255, 150, 50), False, points, 2))
+        return area
 
-    def _draw_info(self, msg: UDPMessage) -> None:
-        """Draw information overlay."""
+    def _draw_info(self, msg: UDPMessage, error_mm: float) -> pygame.Rect:
+        """Draw information overlay. Returns the affected area."""
         info_color = (200, 200, 200)
 
-        # Compute error
-        error = np.sqrt(
-            (msg.cursor_x - msg.target_x)**2 +
-            (msg.cursor_y - msg.target_y)**2
-        ) * 1000  # mm
-
+        # Time changes every frame: render it directly, not via the cache
+        rects = [self.screen.blit(
+            self.font.render(f"Time: {msg.timestamp_us / 1e6:.2f} s", True, info_color),
+            (10, 10)
+        )]
         lines = [
-            f"Time: {msg.timestamp_us / 1e6:.2f} s",
-            f"Pos: ({msg.cursor_x * 1000:.1f}, {msg.cursor_y * 1000:.1f}) mm",
-            f"Target: ({msg.target_x * 1000:.1f}, {msg.target_y * 1000:.1f}) mm",
-            f"Error: {error:.1f} mm",
+            f"Pos: ({_mm(msg.cursor_x):.1f}, {_mm(msg.cursor_y):.1f}) mm",
+            f"Target: ({_mm(msg.target_x):.1f}, {_mm(msg.target_y):.1f}) mm",
+            f"Error: {round(error_mm * 2) / 2:.1f} mm",
             f"State: {msg.task_state.name}",
             f"Trial: {msg.trial_number}",
         ]
 
-        y = 10
+        y = 30
         for line in lines:
-            text = self.font.render(line, True, info_color)
-            self.screen.blit(text, (10, y))
+            text = self._render_text(line, self.font, info_color)
+            rects.append(self.screen.blit(text, (10, y)))
             y += 20
-
-    def _draw_help(self) -> None:
-        """Draw keyboard shortcuts."""
-        help_color = (100, 100, 100)
-        help_text = "T:trace  P:plot  C:clear  ESC:quit"
-        text = self.small_font.render(help_text, True, help_color)
-        self.screen.blit(text, (10, self.config.height - 20))
+        return rects[0].unionall(rects)
+
+    def _draw_help(self) -> pygame.Rect:
+        """Draw keyboard shortcuts. Returns the affected area."""
+        return self.screen.blit(self._help_text, (10, self._height - 20))
+
+    def _render_text(self, text: str, font: pygame.font.Font, color: tuple) -> pygame.Surface:
+        """Render text, reusing the surface if rendered recently."""
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            # Match the display format once, not on every blit
+            surface = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surface
+            if len(self._text_cache) > TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        return surface
 
     def clear_history(self):
         """Clear trace and error history."""
+        self._state_dirty = True
         self.trace.clear()
         self.error_history.clear()
+        self._max_error_mm = 0.0
         self.time_history.clear()
 
     def close(self) -> None: